@@ -1072,3 +1072,25 @@ def test_soft_default() -> None:
     todict = dataclass_to_dict(orig)
     assert todict == {'ival': 2}
     assert dataclass_from_dict(_TestClassE8, todict) == orig
+
+
+def test_subclass() -> None:
+    """Make sure subclasses don't pick up their parent's prep data."""
+
+    @ioprepped
+    @dataclass
+    class _TestParent:
+        ival: int = 1
+
+    @ioprepped
+    @dataclass
+    class _TestChild(_TestParent):
+        ival2: int = 2
+
+    assert dataclass_to_dict(_TestChild(ival=5, ival2=7)) == {
+        'ival': 5,
+        'ival2': 7
+    }
+    obj = dataclass_from_dict(_TestChild, {'ival': 5, 'ival2': 7})
+    assert obj.ival == 5 and obj.ival2 == 7
+    assert dataclass_to_dict(_TestParent(ival=5)) == {'ival': 5}
@@ -16,7 +16,7 @@ import datetime
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from efro.util import enum_by_value, check_utc
-from efro.dataclassio._base import (Codec, _parse_annotated, EXTRA_ATTRS_ATTR,
+from efro.dataclassio._base import (Codec, EXTRA_ATTRS_ATTR,
                                     _is_valid_for_codec, _get_origin,
                                     SIMPLE_TYPES, _raise_type_error,
                                     IOExtendedData)
@@ -174,16 +174,10 @@ class _Inputter(Generic[T]):
 
         extra_attrs = {}
 
-        # noinspection PyDataclass
-        fields = dataclasses.fields(cls)
-        fields_by_name = {f.name: f for f in fields}
-
-        # Preprocess all fields to convert Annotated[] to contained types
-        # and IOAttrs.
-        parsed_field_annotations = {
-            f.name: _parse_annotated(prep.annotations[f.name])
-            for f in fields
-        }
+        # Fields and their parsed annotations (Annotated[] converted
+        # to contained types and IOAttrs) are precalculated at prep time.
+        fields_by_name = prep.fields_by_name
+        parsed_field_annotations = prep.parsed_field_annotations
 
         # Go through all data in the input, converting it to either dataclass
         # args or extra data.
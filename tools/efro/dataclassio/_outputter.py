@@ -16,7 +16,7 @@ import datetime
 from typing import TYPE_CHECKING
 
 from efro.util import check_utc
-from efro.dataclassio._base import (Codec, _parse_annotated, EXTRA_ATTRS_ATTR,
+from efro.dataclassio._base import (Codec, EXTRA_ATTRS_ATTR,
                                     _is_valid_for_codec, _get_origin,
                                     SIMPLE_TYPES, _raise_type_error,
                                     IOExtendedData)
@@ -63,19 +63,16 @@ class _Outputter:
         prep = PrepSession(explicit=False).prep_dataclass(type(obj),
                                                           recursion_level=0)
         assert prep is not None
-        fields = dataclasses.fields(obj)
         out: Optional[dict[str, Any]] = {} if self._create else None
-        for field in fields:
+        for field in prep.fields:
             fieldname = field.name
             if fieldpath:
                 subfieldpath = f'{fieldpath}.{fieldname}'
             else:
                 subfieldpath = fieldname
-            anntype = prep.annotations[fieldname]
+            anntype, ioattrs = prep.parsed_field_annotations[fieldname]
             value = getattr(obj, fieldname)
 
-            anntype, ioattrs = _parse_annotated(anntype)
-
             # If we're not storing default values for this fella,
             # we can skip all output processing if we've got a default value.
             if ioattrs is not None and not ioattrs.store_default:
@@ -95,7 +95,7 @@ def will_ioprep(cls: type[T]) -> type[T]:
 def is_ioprepped_dataclass(obj: Any) -> bool:
     """Return whether the obj is an ioprepped dataclass type or instance."""
     cls = obj if isinstance(obj, type) else type(obj)
-    return dataclasses.is_dataclass(cls) and hasattr(cls, PREP_ATTR)
+    return dataclasses.is_dataclass(cls) and PREP_ATTR in vars(cls)
 
 
 @dataclasses.dataclass
@@ -111,6 +111,15 @@ class PrepData:
     # Map of storage names to attr names.
     storage_names_to_attr_names: dict[str, str]
 
+    # Dataclass fields (in order) and a lookup for them by name.
+    fields: tuple[dataclasses.Field, ...]
+    fields_by_name: dict[str, dataclasses.Field]
+
+    # Field annotations with Annotated[] stripped down to contained types
+    # and IOAttrs. We cache these so encoding/decoding doesn't need to
+    # redo this work for every instance.
+    parsed_field_annotations: dict[str, tuple[Any, Optional[IOAttrs]]]
+
 
 class PrepSession:
     """Context for a prep."""
@@ -130,7 +139,10 @@ class PrepSession:
         # pylint: disable=too-many-branches
 
         # We should only need to do this once per dataclass.
-        existing_data = getattr(cls, PREP_ATTR, None)
+        # Note that we only accept prep data stored on the class itself;
+        # a subclass inheriting its parent's would get the wrong fields.
+        existing_data = (vars(cls).get(PREP_ATTR)
+                         if isinstance(cls, type) else None)
         if existing_data is not None:
             assert isinstance(existing_data, PrepData)
             return existing_data
@@ -148,7 +160,7 @@ class PrepSession:
         # Add a pointer to the prep-session while doing the prep.
         # This way we can ignore types that we're already in the process
         # of prepping and can support recursive types.
-        existing_prep = getattr(cls, PREP_SESSION_ATTR, None)
+        existing_prep = vars(cls).get(PREP_SESSION_ATTR)
         if existing_prep is not None:
             if existing_prep is self:
                 return None
@@ -188,6 +200,7 @@ class PrepSession:
 
         all_storage_names: set[str] = set()
         storage_names_to_attr_names: dict[str, str] = {}
+        parsed_annotations: dict[str, tuple[Any, Optional[IOAttrs]]] = {}
 
         # Ok; we've resolved actual types for this dataclass.
         # now recurse through them, verifying that we support all contained
@@ -195,6 +208,7 @@ class PrepSession:
         for attrname, anntype in resolved_annotations.items():
 
             anntype, ioattrs = _parse_annotated(anntype)
+            parsed_annotations[attrname] = (anntype, ioattrs)
 
             # If we found attached IOAttrs data, make sure it contains
             # valid values for the field it is attached to.
@@ -223,11 +237,17 @@ class PrepSession:
         # Success! Store our resolved stuff with the class and we're done.
         prepdata = PrepData(
             annotations=resolved_annotations,
-            storage_names_to_attr_names=storage_names_to_attr_names)
+            storage_names_to_attr_names=storage_names_to_attr_names,
+            fields=fields,
+            fields_by_name=fields_by_name,
+            parsed_field_annotations={
+                f.name: parsed_annotations[f.name]
+                for f in fields
+            })
         setattr(cls, PREP_ATTR, prepdata)
 
         # Clear our prep-session tag.
-        assert getattr(cls, PREP_SESSION_ATTR, None) is self
+        assert vars(cls).get(PREP_SESSION_ATTR) is self
         delattr(cls, PREP_SESSION_ATTR)
         return prepdata
 
@@ -120,6 +120,11 @@ class MessageProtocol:
         self.log_remote_exceptions = log_remote_exceptions
         self.trusted_sender = trusted_sender
 
+        # EmptyResponse is by far our most common response and always
+        # encodes the same, so we can encode it once up front.
+        self.empty_response_encoded = self.encode_dict(
+            self.response_to_dict(EmptyResponse()))
+
     @staticmethod
     def encode_dict(obj: dict) -> str:
         """Json-encode a provided dict."""
@@ -155,7 +160,13 @@ class MessageProtocol:
         if m_id is None:
             raise TypeError(f'{opname} type is not registered in protocol:'
                             f' {type(message)}')
-        out = {'t': m_id, 'm': dataclass_to_dict(message)}
+        out: dict = {'t': m_id}
+
+        # Skip the 'm' dict entirely if it's empty (decoding allows this).
+        # This keeps common things like EmptyResponse nice and small.
+        msgdict = dataclass_to_dict(message)
+        if msgdict:
+            out['m'] = msgdict
         return out
 
     @staticmethod
@@ -328,7 +339,9 @@ class MessageProtocol:
                 f'\n'
                 f'\n'
                 f'class {ppre}Bound{basename}(BoundMessageSender):\n'
-                f'    """Protocol-specific bound sender."""\n')
+                f'    """Protocol-specific bound sender."""\n'
+                f'\n'
+                f'    __slots__ = ()\n')
 
         def _filt_tp_name(rtype: type[Response]) -> str:
             # We accept None to equal EmptyResponse so reflect that
@@ -490,7 +503,9 @@ class MessageProtocol:
         out += (f'\n'
                 f'\n'
                 f'class {ppre}Bound{basename}(BoundMessageReceiver):\n'
-                f'    """Protocol-specific bound receiver."""\n')
+                f'    """Protocol-specific bound receiver."""\n'
+                f'\n'
+                f'    __slots__ = ()\n')
         if is_async:
             out += (
                 '\n'
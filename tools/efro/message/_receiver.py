@@ -199,6 +199,11 @@ class MessageReceiver:
 
         # A return value of None equals EmptyResponse.
         if response is None:
+            # If there's no filter wanting to look at it, we can simply
+            # send our protocol's pre-encoded EmptyResponse.
+            if self._encode_filter_call is None:
+                assert EmptyResponse in msgtype.get_response_types()
+                return self.protocol.empty_response_encoded
             response = EmptyResponse()
 
         assert isinstance(response, Response)
@@ -276,6 +281,9 @@ class MessageReceiver:
 class BoundMessageReceiver:
     """Base bound receiver class."""
 
+    # These get created for every message handled so keep them lightweight.
+    __slots__ = ('_obj', '_receiver')
+
     def __init__(
         self,
         obj: Any,
@@ -160,6 +160,9 @@ class MessageSender:
 class BoundMessageSender:
     """Base class for bound senders."""
 
+    # These get created for every send so keep them lightweight.
+    __slots__ = ('_obj', '_sender')
+
     def __init__(self, obj: Any, sender: MessageSender) -> None:
         # Note: not checking obj here since we want to support
         # at least our protocol property when accessed via type.